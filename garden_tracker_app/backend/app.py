@@ -1,46 +1,74 @@
 # Backend for Garden Tracker App
 
 import os
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, after_this_request, g, request, jsonify, send_file
+from flask.helpers import get_debug_flag
 from flask_migrate import Migrate
 from dotenv import load_dotenv
 import datetime
 from datetime import date
-from werkzeug.security import generate_password_hash, check_password_hash
-from flask_jwt_extended import create_access_token, JWTManager, jwt_required, get_jwt_identity
+from flask_jwt_extended import create_access_token, jwt_required, get_jwt, get_jwt_identity
 from flask_cors import CORS
+from flask_compress import Compress
+from sqlalchemy import and_, bindparam, delete, event, insert, literal, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import joinedload, raiseload
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import atexit
+import click
+import queue
 import signal
+import functools
+import sqlite3
 import json
 import io
+import orjson
 
 # Import db and models from models.py [CA]
 # Changed from relative (.models) to absolute (models) to work when running flask run within backend dir [REH]
 from models import db, User, GardenBed, PlantType, Planting, GardenLayout
-from validators import validate_bed_shape_and_params  # [DRY][SF]
+from validators import validate_bed_shape_and_params, missing_fields, non_string_fields  # [DRY][SF]
+from jwt_cache import CachingJWTManager
+from json_provider import OrjsonProvider
+from security import hash_password, verify_password
+
+UTC = datetime.timezone.utc
+
+# Load environment variables from .env file
+load_dotenv()
 
 # Configure logging
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+# INFO by default; set LOG_LEVEL=DEBUG for verbose request tracing
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
 
 # Create a rotating file handler
-handler = RotatingFileHandler('app.log', maxBytes=100000, backupCount=1)
+handler = RotatingFileHandler('app.log', maxBytes=5 * 1024 * 1024, backupCount=1)
 handler.setLevel(logging.DEBUG)
 
 # Create a formatter and add it to the handler
 formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 handler.setFormatter(formatter)
 
-# Add the handler to the logger
-logger.addHandler(handler)
-
-# Load environment variables from .env file
-load_dotenv()
+# Request threads only enqueue records; a background listener does the
+# formatting and file writes/rotation off the request path [PA]
+# SimpleQueue: unbounded, lock-free put, and no task tracking the listener doesn't use
+log_queue = queue.SimpleQueue()
+log_listener = QueueListener(log_queue, handler, respect_handler_level=True)
+log_listener.start()
+logger.addHandler(QueueHandler(log_queue))
+# Drain whatever is still queued when the process exits
+atexit.register(log_listener.stop)
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)  # Serialize all jsonify() responses with orjson [PA]
 # Initialize CORS more explicitly, allowing multiple frontend origins
-CORS(app, resources={r"/api/*": {"origins": ["http://localhost:3000", "http://127.0.0.1:3000"]}})
+# Every API call carries an Authorization header, so each one is preflighted;
+# max_age lets the browser reuse a preflight result for an hour instead of
+# sending an OPTIONS round trip ahead of every request [PA]
+CORS(app, resources={r"/api/*": {"origins": ["http://localhost:3000", "http://127.0.0.1:3000"]}}, max_age=3600)
 
 # --- Configuration ---
 # Database Configuration (using environment variable)
@@ -50,12 +78,41 @@ app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL') or 'sqlit
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'a-fallback-secret-key-replace-me')
 app.config['JWT_SECRET_KEY'] = os.environ.get('JWT_SECRET_KEY', 'another-fallback-jwt-secret-replace-me')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+app.config['JWT_DECODE_CACHE_SIZE'] = int(os.environ.get('JWT_DECODE_CACHE_SIZE', 10000))
+app.config['JWT_DECODE_CACHE_TTL'] = int(os.environ.get('JWT_DECODE_CACHE_TTL', 300))
+# Compress JSON bodies of 1 KB and up (the plant catalog, recommendations,
+# layouts); smaller ones aren't worth the CPU [PA]
+app.config['COMPRESS_MIMETYPES'] = ['application/json']
+app.config['COMPRESS_MIN_SIZE'] = 1024
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+if not app.config['SQLALCHEMY_DATABASE_URI'].startswith('sqlite'):
+    # Server databases: keep a warm pool and drop dead connections before use.
+    # Connections are recycled before typical server/proxy idle cutoffs, and LIFO
+    # reuse keeps the hot few warm so idle extras can time out [PA]
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+        # Per worker process: keep pool_size >= GUNICORN_THREADS (gunicorn.conf.py)
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 10)),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 20)),
+        'pool_pre_ping': True, 'pool_recycle': 1800, 'pool_use_lifo': True,
+    }
+@event.listens_for(Engine, 'connect')
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """WAL lets the polled GET endpoints read while a commit is in progress [PA]"""
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')  # Durable enough under WAL, far fewer fsyncs
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA mmap_size=268435456')  # 256MB
+    cursor.close()
 
 db.init_app(app) # Link SQLAlchemy instance to the app
 # Initialize Flask-Migrate [fix]
 migrate = Migrate(app, db)
 
-jwt = JWTManager(app) # Initialize JWT Manager
+Compress(app)
+jwt = CachingJWTManager(app) # Initialize JWT Manager (caches decoded tokens) [PA]
 
 # --- Register plant import blueprint ---
 from plant_import import plant_import_bp
@@ -95,26 +152,58 @@ def missing_token_callback(error_string):
     logger.warning("Unauthorized/Missing token error: %s", error_string)
     return jsonify({"message": "Authorization token is missing or invalid", "error": error_string}), 401
 
-# # --- Database Initialization (Uses imported db and models) ---
-# with app.app_context():
-#     # Drop existing tables and recreate them (NOTE: Destructive for existing data!) [SFT]
-#     # Consider using Flask-Migrate for schema management in production.
-#     db.drop_all()
-#     db.create_all()
-
-#     # Create a test user if none exists (useful for development)
-#     if not User.query.first():
-#         logger.info("No users found. Creating default test user: test@example.com")
-#         test_user = User(
-#             email="test@example.com",
-#             password_hash=generate_password_hash("password123"),
-#             preferred_units="imperial"
-#         )
-#         db.session.add(test_user)
-#         db.session.commit()
-#         logger.info("Default test user created.")
-#     else:
-#         logger.info("Database already contains users.")
+# --- Identity helpers ---
+
+def _current_user_id():
+    """
+    The authenticated user's id as an int. The JWT 'sub' claim must be a
+    string, so tokens also carry it as an integer 'user_id' claim that is read
+    as-is; tokens issued before that claim was an int fall back to 'sub'.
+    """
+    # Resolved once per request and kept on g for any later helper calls [PA]
+    user_id = g.get('current_user_id')
+    if user_id is None:
+        user_id = get_jwt().get('user_id')
+        if type(user_id) is not int:
+            user_id = int(get_jwt_identity())
+        g.current_user_id = user_id
+    return user_id
+
+def _owns_bed(user_id, bed_id):
+    """
+    Whether bed_id exists and belongs to user_id. A LIMIT 1 select of a
+    constant, answered from the user_id index: no columns, no ORM instance [PA]
+    """
+    return db.session.execute(
+        select(literal(1)).where(GardenBed.id == bed_id, GardenBed.user_id == user_id).limit(1)
+    ).scalar() is not None
+
+# --- Database Initialization ---
+# Schema setup is an explicit one-off command, never an import side effect, so
+# worker start-up runs no DDL. Deployed databases are managed with
+# 'flask db upgrade' (Flask-Migrate).
+
+@app.cli.command('init-db')
+@click.option('--drop', is_flag=True, help='Drop all tables first. Destroys existing data!')
+def init_db_command(drop):
+    """Create the tables for local development and a default test user."""
+    if drop:
+        db.drop_all()
+    db.create_all()
+
+    # Create a test user if none exists (useful for development)
+    if db.session.query(User.id).first() is None:
+        logger.info("No users found. Creating default test user: test@example.com")
+        test_user = User(
+            email="test@example.com",
+            password_hash=hash_password("password123"),
+            preferred_units="imperial"
+        )
+        db.session.add(test_user)
+        db.session.commit()
+        click.echo("Default test user created: test@example.com")
+    else:
+        click.echo("Database already contains users.")
 
 # --- API Routes (Placeholder) ---
 
@@ -135,17 +224,24 @@ def register_user():
 
     if not data or not data.get('email') or not data.get('password'):
         return jsonify({'message': 'Email and password are required'}), 400
+    if non_string_fields(data, ('email', 'password')):
+        return jsonify({'message': 'Email and password must be strings'}), 400
 
     email = data.get('email')
     password = data.get('password')
 
     # Check if user already exists
-    existing_user = User.query.filter_by(email=email).first()
-    if existing_user:
+    # Only the id is selected: this is an existence check [PA]
+    existing_user = db.session.query(User.id).filter_by(email=email).first()
+    if existing_user is not None:
         return jsonify({'message': 'Email already registered'}), 409  # Conflict
 
-    # Hash the password
-    hashed_password = generate_password_hash(password, method='pbkdf2:sha256')
+    # Hand the connection back to the pool before the deliberately slow hash;
+    # the INSERT checks out a fresh one [PA]
+    db.session.close()
+
+    # Hash the password (Argon2id) [SFT]
+    hashed_password = hash_password(password)
 
     # Create new user
     new_user = User(email=email, password_hash=hashed_password)
@@ -156,7 +252,7 @@ def register_user():
         user_data = {
             'id': new_user.id,
             'email': new_user.email,
-            'creation_date': new_user.creation_date.isoformat()
+            'creation_date': new_user.creation_date  # Serialized to ISO-8601 by the JSON provider
         }
         return jsonify({'message': 'User registered successfully', 'user': user_data}), 201
     except Exception as e:
@@ -164,20 +260,55 @@ def register_user():
         logger.error("Error registering user: %s", str(e))
         return jsonify({'message': 'Registration failed due to server error'}), 500
 
+# last_login_at is only rewritten when the stored value is older than this
+LAST_LOGIN_RESOLUTION = datetime.timedelta(minutes=5)
+
+def _write_login_changes(user_id, changes):
+    """
+    Apply login's User column updates (login stamp, upgraded hash). Runs when
+    the response is closed, after the request's app context is gone, so it
+    opens its own.
+    """
+    with app.app_context():
+        try:
+            db.session.execute(update(User).where(User.id == user_id).values(**changes))
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error("Error updating user %s after login: %s", user_id, str(e))
+
 @app.route('/api/auth/login', methods=['POST'])
 def login():
     data = request.get_json()
     if not data or not data.get('email') or not data.get('password'):
         return jsonify({"message": "Email and password required"}), 400
-
-    user = User.query.filter_by(email=data['email']).first()
-
-    if user and check_password_hash(user.password_hash, data['password']):
-        # Update last login time
-        user.last_login_at = datetime.datetime.now(datetime.timezone.utc)
+    if non_string_fields(data, ('email', 'password')):
+        return jsonify({"message": "Email and password must be strings"}), 400
+
+    # Only the columns login needs, as a plain row; no User instance to build [PA]
+    user = db.session.execute(
+        select(User.id, User.email, User.password_hash, User.last_login_at)
+        .filter_by(email=data['email'])
+    ).first()
+    # Release the connection while hashing, as in register_user [PA]
+    db.session.close()
+
+    # Unknown emails still pay for a hash verify, so the 401 takes the same time [SFT]
+    matches, needs_rehash = verify_password(user.password_hash if user else None, data['password'])
+    if matches:
+        changes = {}
+        # Upgrade legacy pbkdf2 hashes in the same commit as the login stamp [SFT]
+        if needs_rehash:
+            changes['password_hash'] = hash_password(data['password'])
+        # Update last login time, unless it was stamped moments ago: bursts of
+        # re-authentication then cost no write at all [PA]
+        now = datetime.datetime.now(UTC)
+        last_login_at = user.last_login_at
+        if last_login_at is not None and last_login_at.tzinfo is None:
+            last_login_at = last_login_at.replace(tzinfo=UTC)
+        if last_login_at is None or now - last_login_at >= LAST_LOGIN_RESOLUTION:
+            changes['last_login_at'] = now
         try:
-            db.session.commit()
-            
             # Create a simple token with just the user ID as string
             user_id_str = str(user.id)
             
@@ -185,12 +316,25 @@ def login():
             access_token = create_access_token(
                 identity=user_id_str,
                 additional_claims={
-                    'user_id': user_id_str,
+                    # Integer copy of 'sub' so handlers skip the str->int parse [PA]
+                    'user_id': user.id,
                     'email': user.email
                 }
             )
             
             logger.info("Successfully created JWT token with identity: %s", user_id_str)
+
+            if changes:
+                # Only once the token exists, so a failed login writes nothing.
+                # The write runs after the response has gone out, so the client
+                # never waits on this commit. A failed write is logged and simply
+                # retried on the next login [PA]
+                user_id = user.id
+
+                @after_this_request
+                def _defer_login_write(response):
+                    response.call_on_close(lambda: _write_login_changes(user_id, changes))
+                    return response
             
             return jsonify({
                 "message": "Login successful",
@@ -201,18 +345,47 @@ def login():
                 }
             }), 200
         except Exception as e:
-            db.session.rollback()
-            logger.error("Error updating last login or creating token: %s", str(e))
+            logger.error("Error creating token: %s", str(e))
             return jsonify({"message": "Login failed due to server error"}), 500
     else:
         return jsonify({"message": "Invalid credentials"}), 401
 
+# --- Parsing helpers ---
+
+def _parse_date(value):
+    """
+    Parse an optional 'YYYY-MM-DD' string. Empty/None gives None; anything
+    else malformed raises ValueError. fromisoformat parses in C with no
+    format string to interpret [PA]
+    """
+    return date.fromisoformat(value) if value else None
+
+# --- Response helpers ---
+
+# --- Conditional GET helpers ---
+
+def _not_modified(etag):
+    """Return a bodyless 304 if the client's If-None-Match already has etag, else None."""
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304)
+        response.set_etag(etag, weak=True)
+        return response
+    return None
+
+def _version_tag(prefix, count, newest):
+    """Build an ETag value from a row count and the newest last_modified."""
+    return f"{prefix}-{count}-{newest.isoformat() if newest else 0}"
+
 # --- Garden Bed API Routes ---
 
+# Fields of each bed in the GET /api/garden-beds listing
+_BED_LIST_FIELDS = ('id', 'name', 'length', 'width', 'shape', 'shape_params', 'unit_measure', 'notes')
+
 @app.route('/api/garden-beds', methods=['GET'])
 @jwt_required()
 def get_garden_beds():
-    logger.info("\n=== Garden Beds Request Received ===")
+    # Per-request tracing is DEBUG-only; one isEnabledFor check skips it all [PA]
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
     try:
         # Get the JWT token from the request
         # auth_header = request.headers.get('Authorization') # Removed logging [SFT]
@@ -220,45 +393,63 @@ def get_garden_beds():
             # logger.info("Authorization header: %s", auth_header)
 
         # Get the current user ID from the token
-        current_user_id = get_jwt_identity()
-        logger.info("Current user ID from token: %s", current_user_id)
-        logger.info("Type of user ID: %s", type(current_user_id))
-
-        user = User.query.get(current_user_id)
-        if not user:
-            logger.warning("User not found for ID: %s", current_user_id)
-            return jsonify({"message": "User not found"}), 404
-
-        garden_beds = GardenBed.query.filter_by(user_id=current_user_id).all()
-        beds_list = [
-            {
-                'id': bed.id,
-                'name': bed.name,
-                'length': bed.length,
-                'width': bed.width,
-                'shape': bed.shape,
-                'shape_params': bed.shape_params,
-                'unit_measure': bed.unit_measure,
-                'notes': bed.notes
-            }
-            for bed in garden_beds
-        ]
-
-        logger.info("=== Garden Beds Response ===")
-        logger.info("Found %d garden beds", len(garden_beds))
-        logger.info("=== End of Request ===\n")
-        
-        return jsonify(beds_list), 200
+        current_user_id = _current_user_id()
+        if debug_enabled:
+            logger.debug("Garden beds request from user %s", current_user_id)
+
+        # No separate User lookup: the JWT is the identity proof, and a user with
+        # no beds (or no row) simply gets an empty list [PA]
+
+        # Conditional GET: one aggregate over the user_id index decides whether
+        # the client's copy is still current [PA]
+        count, newest = db.session.query(
+            db.func.count(GardenBed.id), db.func.max(GardenBed.last_modified)
+        ).filter(GardenBed.user_id == current_user_id).one()
+        version = _version_tag(f"beds-{current_user_id}", count, newest)
+        not_modified = _not_modified(version)
+        if not_modified:
+            return not_modified
+
+        # Select only the serialized columns: plain rows, no ORM instances to build [PA]
+        garden_beds = db.session.execute(
+            select(*(getattr(GardenBed, field) for field in _BED_LIST_FIELDS))
+            .where(GardenBed.user_id == current_user_id)
+        ).all()
+        # Rows become dicts via zip over a field tuple throughout this module;
+        # Row._asdict() goes through the row mapping and is several times slower
+        beds_list = [dict(zip(_BED_LIST_FIELDS, bed)) for bed in garden_beds]
+
+        if debug_enabled:
+            logger.debug("Found %d garden beds for user %s", len(garden_beds), current_user_id)
+
+        response = jsonify(beds_list)
+        response.set_etag(version, weak=True)
+        return response, 200
 
     except Exception as e:
         logger.error("Error in get_garden_beds: %s", str(e))
         raise
 
+def _insert_returning(model, values, columns):
+    """
+    INSERT one row and return the given columns ({response key: model
+    attribute}) as a dict. Uses INSERT ... RETURNING where the database
+    supports it, so nothing is re-read after commit [PA]; SQLite older than
+    3.35 has no RETURNING, so it goes through the ORM add/flush instead.
+    """
+    if db.engine.dialect.insert_returning:
+        stmt = insert(model).values(**values).returning(*columns.values())
+        return dict(zip(columns, db.session.execute(stmt).one()))
+    obj = model(**values)
+    db.session.add(obj)
+    db.session.flush()  # Assigns the id and the column defaults
+    return {key: getattr(obj, column.key) for key, column in columns.items()}
+
 @app.route('/api/garden-beds', methods=['POST'])
 @jwt_required()
 def create_garden_bed():
     """Create a new garden bed for the authenticated user"""
-    current_user_id = get_jwt_identity()
+    current_user_id = _current_user_id()
     
     try:
         data = request.get_json()
@@ -273,29 +464,29 @@ def create_garden_bed():
         is_valid, err = validate_bed_shape_and_params(data["shape"], data["shape_params"])
         if not is_valid:
             return jsonify({"message": f"Invalid shape/params: {err}"}), 400
-        # Create new garden bed
-        new_bed = GardenBed(
-            name=data['name'],
-            shape=data['shape'],
-            shape_params=data['shape_params'],
-            unit_measure=data['unit_measure'],
-            notes=data.get('notes', ''),
-            user_id=current_user_id
+        # Create new garden bed; the insert hands back the response columns
+        # without an ORM refresh after commit [PA]
+        new_bed = _insert_returning(
+            GardenBed,
+            {
+                'name': data['name'],
+                'shape': data['shape'],
+                'shape_params': data['shape_params'],
+                'unit_measure': data['unit_measure'],
+                'notes': data.get('notes', ''),
+                'user_id': current_user_id
+            },
+            {
+                'id': GardenBed.id, 'name': GardenBed.name, 'shape': GardenBed.shape,
+                'shape_params': GardenBed.shape_params, 'unit_measure': GardenBed.unit_measure,
+                'notes': GardenBed.notes, 'created_at': GardenBed.creation_date
+            }
         )
-        db.session.add(new_bed)
         db.session.commit()
         logger.info("Created new garden bed for user %s", current_user_id)
         return jsonify({
             "message": "Garden bed created successfully",
-            "garden_bed": {
-                "id": new_bed.id,
-                "name": new_bed.name,
-                "shape": new_bed.shape,
-                "shape_params": new_bed.shape_params,
-                "unit_measure": new_bed.unit_measure,
-                "notes": new_bed.notes,
-                "created_at": new_bed.creation_date.isoformat()
-            }
+            "garden_bed": new_bed
         }), 201
         
     except ValueError as e:
@@ -309,71 +500,41 @@ def create_garden_bed():
 @app.route('/api/garden-beds/<int:bed_id>', methods=['GET'])
 @jwt_required()  # Protect this route
 def get_bed_details(bed_id):
-    current_user_id = get_jwt_identity()
+    current_user_id = _current_user_id()
     try:
-        # Get the JWT token from the request
-        # auth_header = request.headers.get('Authorization')
-        # if auth_header:
-            # logger.info("Authorization header: %s", auth_header)
-
-        # Get the current user ID from the token
-        current_user_id = get_jwt_identity()
-        logger.info("Current user ID from token: %s", current_user_id)
-        logger.info("Type of user ID: %s", type(current_user_id))
-
-        user = User.query.get(current_user_id)
-        if not user:
-            logger.warning("User not found for ID: %s", current_user_id)
-            return jsonify({"message": "User not found"}), 404
-
-        garden_beds = GardenBed.query.filter_by(user_id=current_user_id).all()
-        beds_list = [
-            {
-                'id': bed.id,
-                'name': bed.name,
-                'length': bed.length,
-                'width': bed.width,
-                'notes': bed.notes
-            }
-            for bed in garden_beds
-        ]
+        # Fetch just this bed, scoped to the caller; not-owned reads as not-found [SFT][PA]
+        bed = GardenBed.query.filter_by(id=bed_id, user_id=current_user_id).first()
+        if not bed:
+            logger.warning("Garden bed %s not found for user %s", bed_id, current_user_id)
+            return jsonify({"message": "Garden bed not found"}), 404
 
-        logger.info("=== Garden Beds Response ===")
-        logger.info("Found %d garden beds", len(garden_beds))
-        logger.info("=== End of Request ===\n")
-        
-        return jsonify(beds_list), 200
+        # The row is already loaded, so a matching If-None-Match only saves the
+        # serialization and the body, at no extra query [PA]
+        version = f"bed-{bed.id}-{bed.last_modified.isoformat() if bed.last_modified else 0}"
+        not_modified = _not_modified(version)
+        if not_modified:
+            return not_modified
+        response = jsonify(bed.to_dict())
+        response.set_etag(version, weak=True)
+        return response
 
     except Exception as e:
-        logger.error("Error in get_garden_beds: %s", str(e))
+        logger.error("Error in get_bed_details: %s", str(e))
         raise
 
 @app.route('/api/garden-beds/<int:bed_id>', methods=['PUT'])
 @jwt_required()  # Protect this route
 def update_garden_bed(bed_id):
-    current_user_id = get_jwt_identity()
-    logger.info(f"User {current_user_id} attempting to update garden bed ID {bed_id}")
+    current_user_id = _current_user_id()
+    logger.info("User %s attempting to update garden bed ID %s", current_user_id, bed_id)
     try:
-        bed = GardenBed.query.get(bed_id)
+        # Fetch and verify ownership in one query [SFT][PA]
+        # Not-found and not-owned both return 404 so bed IDs can't be probed
+        bed = GardenBed.query.filter_by(id=bed_id, user_id=current_user_id).first()
         if not bed:
-            logger.warning(f"Garden bed ID {bed_id} not found for update attempt by user {current_user_id}")
+            logger.warning("Garden bed ID %s not found or not owned by user %s", bed_id, current_user_id)
             return jsonify({"message": "Garden bed not found"}), 404
 
-        # Add logging to check user IDs before comparison [REH][SD]
-        logger.debug(f"Checking ownership for bed ID {bed_id}: Bed owner ID = {bed.user_id} (type: {type(bed.user_id)}), Current user ID = {current_user_id} (type: {type(current_user_id)})")
-
-        # Verify the bed belongs to the current user [SFT]
-        # Convert JWT identity (string) to int for comparison with DB ID (int) [REH]
-        try:
-            current_user_id_int = int(current_user_id)
-        except ValueError:
-            logger.error(f"Could not convert current_user_id '{current_user_id}' to int for ownership check.")
-            return jsonify({"message": "Internal server error during authorization"}), 500
-        
-        if bed.user_id != current_user_id_int:
-            logger.warning(f"User {current_user_id_int} forbidden from updating bed ID {bed_id} owned by {bed.user_id}")
-            return jsonify({"message": "Forbidden"}), 403
-
         data = request.get_json()
         if not data:
             return jsonify({"message": "No input data provided"}), 400
@@ -392,20 +553,20 @@ def update_garden_bed(bed_id):
             bed.unit_measure = data['unit_measure']
         if 'notes' in data and data['notes'] is not None:
             bed.notes = data['notes']
-        bed.last_modified = datetime.datetime.now(datetime.timezone.utc) # Update last modified time
+        bed.last_modified = datetime.datetime.now(UTC) # Update last modified time
         db.session.commit()
-        logger.info(f"Garden bed ID {bed_id} updated successfully by user {current_user_id_int}")
+        logger.info("Garden bed ID %s updated successfully by user %s", bed_id, current_user_id)
         return jsonify(bed.to_dict()), 200
 
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Error updating garden bed ID {bed_id}: {e}", exc_info=True)
+        logger.error("Error updating garden bed ID %s: %s", bed_id, e, exc_info=True)
         return jsonify({"message": "Failed to update garden bed", "error": str(e)}), 500
 
 @app.route('/api/garden-beds/<int:bed_id>', methods=['DELETE'])
 @jwt_required()  # Protect this route
 def delete_bed(bed_id):
-    current_user_id = get_jwt_identity()
+    current_user_id = _current_user_id()
     # bed = GardenBed.query.get(bed_id)
     bed = GardenBed.query.filter_by(id=bed_id, user_id=current_user_id).first()
 
@@ -424,13 +585,45 @@ def delete_bed(bed_id):
 
 # --- Plant Type API Routes ---
 
+# Last serialized catalog, keyed by the version it was built from [PA]
+_plant_catalog_cache = (None, None)
+
+# Columns served by /api/plants: PlantType.to_dict()'s keys. The plant list's
+# edit form is pre-filled from this payload, so description/notes stay in
+_PLANT_FIELDS = (
+    'id', 'common_name', 'scientific_name', 'description',
+    'avg_height', 'avg_spread', 'rotation_family', 'notes',
+)
+
+def _plant_catalog_version():
+    """Cheap catalog fingerprint: row count plus newest last_modified, in one query."""
+    count, newest = db.session.query(db.func.count(PlantType.id), db.func.max(PlantType.last_modified)).one()
+    return _version_tag('plants', count, newest)
+
 @app.route('/api/plants', methods=['GET'])
 def get_all_plant_types():
+    global _plant_catalog_cache
     try:
-        plants = PlantType.query.order_by(PlantType.common_name).all()
-        # Use the to_dict() method for serialization [DRY] [CA]
-        plants_data = [plant.to_dict() for plant in plants]
-        return jsonify(plants_data), 200
+        # The version is read from the DB, so writes from any worker invalidate it [PA]
+        version = _plant_catalog_version()
+        not_modified = _not_modified(version)
+        if not_modified:
+            return not_modified
+
+        # The cache holds the serialized body, so a hit skips jsonify too [PA]
+        cached_version, body = _plant_catalog_cache
+        if cached_version != version:
+            # Only the served columns, as plain rows: no ORM instances or identity
+            # map entries for a catalog that is rebuilt wholesale [PA]
+            plants = db.session.query(
+                *(getattr(PlantType, field) for field in _PLANT_FIELDS)
+            ).order_by(PlantType.common_name).all()
+            body = orjson.dumps([dict(zip(_PLANT_FIELDS, plant)) for plant in plants])
+            _plant_catalog_cache = (version, body)
+
+        response = app.response_class(body, mimetype='application/json')
+        response.set_etag(version, weak=True)
+        return response, 200
     except Exception as e:
         logger.error("Error retrieving plant types: %s", str(e))
         return jsonify({'message': 'Failed to retrieve plant types due to server error'}), 500
@@ -438,22 +631,22 @@ def get_all_plant_types():
 @app.route('/api/plants', methods=['POST'])
 def create_plant_type():
     data = request.get_json()
-    logger.debug(f"Received data for new plant: {data}")
+    logger.debug("Received data for new plant: %s", data)
 
     # Basic Input Validation [IV] [REH]
     required_fields = ['common_name', 'scientific_name']
     if not data:
         logger.warning("Create plant request failed: No data received.")
         return jsonify({'message': 'No input data provided'}), 400
-    if not all(field in data and data[field] for field in required_fields):
-        missing = [field for field in required_fields if field not in data or not data[field]]
-        logger.warning(f"Create plant request failed: Missing fields: {missing}")
+    missing = missing_fields(data, required_fields)  # Single pass over the fields [PA]
+    if missing:
+        logger.warning("Create plant request failed: Missing fields: %s", missing)
         return jsonify({'message': f'Missing required fields: {", ".join(missing)}'}), 400
 
     # Check for existing plant (optional, based on requirements - e.g., unique scientific_name)
     # existing = PlantType.query.filter_by(scientific_name=data['scientific_name']).first()
     # if existing:
-    #     logger.warning(f"Attempt to create duplicate plant: {data['scientific_name']}")
+    #     logger.warning("Attempt to create duplicate plant: %s", data['scientific_name'])
     #     return jsonify({'message': 'Plant with this scientific name already exists'}), 409 # Conflict
 
     try:
@@ -466,7 +659,7 @@ def create_plant_type():
         )
         db.session.add(new_plant)
         db.session.commit()
-        logger.info(f"New plant created: {new_plant.common_name} (ID: {new_plant.id})")
+        logger.info("New plant created: %s (ID: %s)", new_plant.common_name, new_plant.id)
         # Return the created plant data [ISA]
         return jsonify(new_plant.to_dict()), 201 # 201 Created
     except Exception as e:
@@ -477,7 +670,7 @@ def create_plant_type():
 @app.route('/api/plants/<int:plant_type_id>', methods=['GET'])
 def get_plant_type_details(plant_type_id):
     try:
-        plant = PlantType.query.get(plant_type_id)
+        plant = db.session.get(PlantType, plant_type_id)
 
         if not plant:
             return jsonify({'message': 'Plant type not found'}), 404
@@ -490,29 +683,59 @@ def get_plant_type_details(plant_type_id):
 
 # --- Planting History API Routes ---
 
+# Keys of each planting in GET /api/garden-beds/<id>/plantings, in select order
+_PLANTING_FIELDS = (
+    'id', 'bed_id', 'plant_type_id', 'plant_common_name', 'year', 'season',
+    'date_planted', 'expected_harvest_date', 'notes', 'is_current', 'quantity',
+)
+
 @app.route('/api/garden-beds/<int:bed_id>/plantings', methods=['GET'])
 @jwt_required()  # Protect this route
 def get_plantings_for_bed(bed_id):
     """ Get all plantings for a specific bed, optionally filtered by active status. """
-    user_id = get_jwt_identity()
-    logger.debug(f"User {user_id} fetching plantings for bed {bed_id}")
-
-    # Verify the bed exists and belongs to the user
-    bed = GardenBed.query.filter_by(id=bed_id, user_id=user_id).first()
-    if not bed:
-        logger.warning(f"Auth failed or bed not found: User {user_id}, bed {bed_id}.")
-        return jsonify({'message': 'Garden bed not found or access denied'}), 404
+    user_id = _current_user_id()
+    logger.debug("User %s fetching plantings for bed %s", user_id, bed_id)
 
     # Check for 'active' query parameter
     show_active_only = request.args.get('active', 'false').lower() == 'true'
-    logger.debug(f"Filtering active plantings for bed {bed_id}: {show_active_only}")
+    logger.debug("Filtering active plantings for bed %s: %s", bed_id, show_active_only)
 
-    query = Planting.query.filter_by(bed_id=bed_id)
+    # One query checks the bed exists and belongs to the user and computes the
+    # conditional-GET version of its plantings: grouping on the bed yields no
+    # row when it isn't the user's, and (0, NULL) when it has no plantings [SFT][PA]
+    plantings_join = Planting.bed_id == GardenBed.id
+    if show_active_only:
+        plantings_join = and_(plantings_join, Planting.is_current.is_(True))
+    version_row = db.session.execute(
+        select(db.func.count(Planting.id), db.func.max(Planting.last_modified))
+        .select_from(GardenBed).outerjoin(Planting, plantings_join)
+        .where(GardenBed.id == bed_id, GardenBed.user_id == user_id)
+        .group_by(GardenBed.id)
+    ).first()
+    if version_row is None:
+        logger.warning("Auth failed or bed not found: User %s, bed %s.", user_id, bed_id)
+        return jsonify({'message': 'Garden bed not found or access denied'}), 404
+
+    # Conditional GET keyed on this bed's plantings and the active filter [PA]
+    count, newest = version_row
+    version = _version_tag(f"plantings-{bed_id}-{'active' if show_active_only else 'all'}", count, newest)
+    not_modified = _not_modified(version)
+    if not_modified:
+        return not_modified
+
+    # Select the serialized columns (plant name joined in) as plain Core rows:
+    # no ORM instances to build and no per-field to_dict() calls [PA]
+    query = select(
+        Planting.id, Planting.bed_id, Planting.plant_type_id,
+        db.func.coalesce(PlantType.common_name, 'Unknown Plant Type'),
+        Planting.year, Planting.season, Planting.date_planted, Planting.expected_harvest_date,
+        Planting.notes, Planting.is_current, Planting.quantity
+    ).outerjoin(PlantType, Planting.plant_type_id == PlantType.id).where(Planting.bed_id == bed_id)
 
     if show_active_only:
          # Filter based on the 'is_current' flag instead of dates [Fix][SF]
-         logger.debug(f"Applying is_current filter for bed {bed_id}")
-         query = query.filter(Planting.is_current.is_(True))
+         logger.debug("Applying is_current filter for bed %s", bed_id)
+         query = query.where(Planting.is_current.is_(True))
          # Previous date-based logic (commented out for reference):
          # today = datetime.date.today()
          # query = query.filter(
@@ -523,12 +746,32 @@ def get_plantings_for_bed(bed_id):
     # Order results, e.g., by year then season (optional)
     query = query.order_by(Planting.year.desc(), Planting.season)
 
-    plantings = query.all()
+    plantings = db.session.execute(query).all()
     
-    # Use the to_dict() method for serialization [DRY]
-    plantings_list = [p.to_dict() for p in plantings]
-    logger.info(f"Returning {len(plantings_list)} plantings for bed {bed_id} (active filter: {show_active_only}).")
-    return jsonify(plantings_list)
+    # Same keys as Planting.to_dict(); orjson writes the dates as ISO-8601
+    # straight into the response body
+    response = jsonify([dict(zip(_PLANTING_FIELDS, p)) for p in plantings])
+    logger.info("Returning %d plantings for bed %s (active filter: %s).", len(plantings), bed_id, show_active_only)
+    response.set_etag(version, weak=True)
+    return response
+
+# Plant type names by id. Plant types are only ever added through the API,
+# never renamed or deleted, so a cached name can't go stale and needs no
+# invalidation. lru_cache is thread-safe and doesn't cache exceptions, so
+# misses (including unknown ids) always go to the DB [PA]
+@functools.lru_cache(maxsize=1024)
+def _cached_plant_type_name(plant_type_id):
+    name = db.session.query(PlantType.common_name).filter(PlantType.id == plant_type_id).scalar()
+    if name is None:
+        raise LookupError(plant_type_id)
+    return name
+
+def _plant_type_name(plant_type_id):
+    """common_name of a plant type, or None when no such id exists."""
+    try:
+        return _cached_plant_type_name(plant_type_id)
+    except LookupError:
+        return None
 
 @app.route('/api/garden-beds/<int:bed_id>/plantings', methods=['POST'])
 @jwt_required()  # Protect this route
@@ -536,11 +779,10 @@ def add_planting(bed_id):
     # TODO: Replace with actual user identification from auth token
     # For now, assume user 1
     # user_id = 1
-    current_user_id = get_jwt_identity()
+    current_user_id = _current_user_id()
 
     # Check if bed exists and belongs to user
-    bed = GardenBed.query.filter_by(id=bed_id, user_id=current_user_id).first()
-    if not bed:
+    if not _owns_bed(current_user_id, bed_id):
         return jsonify({'message': 'Garden bed not found or access denied'}), 404
 
     data = request.get_json()
@@ -558,43 +800,39 @@ def add_planting(bed_id):
     if not plant_type_id or not year or not season:
         return jsonify({'message': 'Plant type ID, year, and season are required'}), 400
 
-    # Check if plant type exists
-    plant_type = PlantType.query.get(plant_type_id)
-    if not plant_type:
+    # Check if plant type exists, fetching only the name the response needs [PA]
+    plant_common_name = _plant_type_name(plant_type_id)
+    if plant_common_name is None:
         return jsonify({'message': f'Plant type with id {plant_type_id} not found'}), 404
 
     # Convert date string to date object if provided
-    date_planted = None
-    if date_planted_str:
-        try:
-            date_planted = datetime.datetime.strptime(date_planted_str, '%Y-%m-%d').date()
-        except ValueError:
-            return jsonify({'message': 'Invalid date format for date_planted. Use YYYY-MM-DD.'}), 400
-
-    new_planting = Planting(
-        bed_id=bed_id,
-        plant_type_id=plant_type_id,
-        year=year,
-        season=season,
-        date_planted=date_planted,
-        notes=notes,
-        is_current=is_current
-    )
-    db.session.add(new_planting)
     try:
+        date_planted = _parse_date(date_planted_str)
+    except ValueError:
+        return jsonify({'message': 'Invalid date format for date_planted. Use YYYY-MM-DD.'}), 400
+
+    try:
+        # Single INSERT ... RETURNING where supported; no ORM refresh after commit [PA]
+        planting_data = _insert_returning(
+            Planting,
+            {
+                'bed_id': bed_id,
+                'plant_type_id': plant_type_id,
+                'year': year,
+                'season': season,
+                'date_planted': date_planted,
+                'notes': notes,
+                'is_current': is_current
+            },
+            {
+                'id': Planting.id, 'bed_id': Planting.bed_id, 'plant_type_id': Planting.plant_type_id,
+                'year': Planting.year, 'season': Planting.season, 'date_planted': Planting.date_planted,
+                'notes': Planting.notes, 'is_current': Planting.is_current
+            }
+        )
         db.session.commit()
         # Return the created planting details
-        planting_data = {
-            'id': new_planting.id,
-            'bed_id': new_planting.bed_id,
-            'plant_type_id': new_planting.plant_type_id,
-            'plant_common_name': plant_type.common_name,  # Access related object
-            'year': new_planting.year,
-            'season': new_planting.season,
-            'date_planted': new_planting.date_planted.isoformat() if new_planting.date_planted else None,
-            'notes': new_planting.notes,
-            'is_current': new_planting.is_current
-        }
+        planting_data['plant_common_name'] = plant_common_name
         return jsonify({'message': 'Planting recorded successfully', 'planting': planting_data}), 201
     except Exception as e:
         db.session.rollback()
@@ -605,36 +843,35 @@ def add_planting(bed_id):
 @jwt_required()  # Protect this route
 def update_planting(planting_id):
     """ Updates an existing planting record. """
-    user_id = get_jwt_identity()
-    logger.debug(f"User {user_id} attempting to update planting {planting_id}")
-
-    planting = Planting.query.get(planting_id)
+    user_id = _current_user_id()
+    logger.debug("User %s attempting to update planting %s", user_id, planting_id)
+
+    # Fetch the planting and verify its bed belongs to the user in one query [SFT][PA]
+    # The plant type rides along in the same SELECT; to_dict() reads its name
+    planting = Planting.query.options(joinedload(Planting.plant_type)) \
+        .join(GardenBed, Planting.bed_id == GardenBed.id) \
+        .filter(Planting.id == planting_id, GardenBed.user_id == user_id).first()
     if not planting:
-        logger.warning(f"Update failed: Planting {planting_id} not found.")
+        logger.warning("Update failed: Planting %s not found or not owned by user %s.", planting_id, user_id)
         return jsonify({'message': 'Planting record not found'}), 404
 
-    # Verify the planting belongs to a bed owned by the user
-    bed = GardenBed.query.filter_by(id=planting.bed_id, user_id=user_id).first()
-    if not bed:
-        logger.warning(f"Auth failed: User {user_id} cannot update planting {planting_id} in bed {planting.bed_id}.")
-        return jsonify({'message': 'Unauthorized to update this planting record'}), 403
-
     data = request.get_json()
     if not data:
-        logger.warning(f"Update failed for planting {planting_id}: No data provided.")
+        logger.warning("Update failed for planting %s: No data provided.", planting_id)
         return jsonify({'message': 'No update data provided'}), 400
 
-    logger.debug(f"Received update data for planting {planting_id}: {data}")
+    logger.debug("Received update data for planting %s: %s", planting_id, data)
 
     # Validate and update fields [IV]
     updated = False
     if 'plant_type_id' in data:
         # Ensure plant_type exists (optional, depends on requirements)
-        plant_type = PlantType.query.get(data['plant_type_id'])
+        plant_type = db.session.get(PlantType, data['plant_type_id'])
         if not plant_type:
-            logger.warning(f"Update failed for planting {planting_id}: Invalid plant_type_id {data['plant_type_id']}.")
+            logger.warning("Update failed for planting %s: Invalid plant_type_id %s.", planting_id, data['plant_type_id'])
             return jsonify({'message': f"Invalid plant type ID: {data['plant_type_id']}"}), 400
         planting.plant_type_id = data['plant_type_id']
+        planting.plant_type = plant_type  # Keep the relationship in step; it isn't expired on commit
         updated = True
 
     # Safely update other fields, checking for presence in data
@@ -643,7 +880,7 @@ def update_planting(planting_id):
             planting.year = int(data['year'])
             updated = True
         except (ValueError, TypeError):
-             logger.warning(f"Update failed for planting {planting_id}: Invalid year format {data['year']}.")
+             logger.warning("Update failed for planting %s: Invalid year format %s.", planting_id, data['year'])
              return jsonify({'message': 'Invalid year format'}), 400
              
     if 'season' in data:
@@ -653,25 +890,19 @@ def update_planting(planting_id):
     if 'date_planted' in data:
         try:
             # Handle empty string or null for clearing the date
-            if data['date_planted']:
-                planting.date_planted = datetime.date.fromisoformat(data['date_planted'])
-            else:
-                planting.date_planted = None
+            planting.date_planted = _parse_date(data['date_planted'])
             updated = True
         except (ValueError, TypeError):
-            logger.warning(f"Update failed for planting {planting_id}: Invalid date_planted format {data['date_planted']}.")
+            logger.warning("Update failed for planting %s: Invalid date_planted format %s.", planting_id, data['date_planted'])
             return jsonify({'message': 'Invalid date planted format (YYYY-MM-DD)'}), 400
             
     if 'expected_harvest_date' in data:
         try:
              # Handle empty string or null for clearing the date
-            if data['expected_harvest_date']:
-                planting.expected_harvest_date = datetime.date.fromisoformat(data['expected_harvest_date'])
-            else:
-                 planting.expected_harvest_date = None
+            planting.expected_harvest_date = _parse_date(data['expected_harvest_date'])
             updated = True
         except (ValueError, TypeError):
-            logger.warning(f"Update failed for planting {planting_id}: Invalid expected_harvest_date format {data['expected_harvest_date']}.")
+            logger.warning("Update failed for planting %s: Invalid expected_harvest_date format %s.", planting_id, data['expected_harvest_date'])
             return jsonify({'message': 'Invalid expected harvest date format (YYYY-MM-DD)'}), 400
 
     if 'notes' in data: # Allow setting notes to empty string
@@ -687,23 +918,23 @@ def update_planting(planting_id):
         if isinstance(data['is_current'], bool):
             planting.is_current = data['is_current']
             updated = True
-            logger.debug(f"Setting is_current for planting {planting_id} to {data['is_current']}")
+            logger.debug("Setting is_current for planting %s to %s", planting_id, data['is_current'])
         else:
-            logger.warning(f"Update failed for planting {planting_id}: Invalid is_current value type {type(data['is_current'])}.")
+            logger.warning("Update failed for planting %s: Invalid is_current value type %s.", planting_id, type(data['is_current']))
             return jsonify({'message': "Invalid value for 'is_current', must be boolean (true/false)"}), 400
 
     if not updated:
-        logger.info(f"No valid fields provided for update on planting {planting_id}")
+        logger.info("No valid fields provided for update on planting %s", planting_id)
         return jsonify({'message': 'No valid fields provided for update'}), 400
 
     try:
         db.session.commit()
-        logger.info(f"Planting {planting_id} updated successfully by user {user_id}.")
+        logger.info("Planting %s updated successfully by user %s.", planting_id, user_id)
         # Return the updated object using to_dict [DRY]
         return jsonify(planting.to_dict()), 200
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Database error updating planting {planting_id}: {str(e)}")
+        logger.error("Database error updating planting %s: %s", planting_id, e)
         return jsonify({'message': 'Update failed due to server error'}), 500
 
 @app.route('/api/plantings/<int:planting_id>', methods=['DELETE'])
@@ -711,19 +942,22 @@ def update_planting(planting_id):
 def delete_planting(planting_id):
     # TODO: Replace with actual user identification from auth token
     # user_id = 1
-    current_user_id = get_jwt_identity()
-
-    planting = Planting.query.get(planting_id)
-    if not planting:
-        return jsonify({'message': 'Planting record not found'}), 404
-
-    # Check ownership
-    bed = GardenBed.query.filter_by(id=planting.bed_id, user_id=current_user_id).first()
-    if not bed:
-        return jsonify({'message': 'Access denied to this planting record'}), 403
+    current_user_id = _current_user_id()
 
     try:
-        db.session.delete(planting)
+        # One DELETE scoped to the user's beds: no load, no separate ownership
+        # SELECT. Not-found and not-owned both give 404, as in update_planting [SFT][PA]
+        result = db.session.execute(
+            delete(Planting)
+            .where(
+                Planting.id == planting_id,
+                Planting.bed_id.in_(select(GardenBed.id).where(GardenBed.user_id == current_user_id)),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            db.session.rollback()
+            return jsonify({'message': 'Planting record not found'}), 404
         db.session.commit()
         return jsonify({'message': 'Planting record deleted successfully'}), 200
     except Exception as e:
@@ -734,73 +968,176 @@ def delete_planting(planting_id):
 # --- Planting Recommendations API Route ---
 
 # --- Garden Layout API Routes ---
-from flask_jwt_extended import jwt_required, get_jwt_identity
-import json
+
+# Statements for the per-request layout reads, built once at import; only the
+# bound user id changes between calls [PA]
+_layout_version_by_user_stmt = select(GardenLayout.id, GardenLayout.last_modified).where(
+    GardenLayout.user_id == bindparam('uid')
+)
+_layout_json_by_user_stmt = select(GardenLayout.layout_json).where(GardenLayout.user_id == bindparam('uid'))
+
+def _layout_object_bytes(user_id, version_row):
+    """
+    The user's layout serialized like GardenLayout.to_dict(), or b'null' when
+    none is saved. version_row is the (id, last_modified) row already read for
+    the ETag.
+    """
+    layout_json = db.session.scalar(_layout_json_by_user_stmt, {'uid': user_id}) if version_row else None
+    if layout_json is None:
+        return b'null'
+    # The stored JSON text is spliced in as-is instead of being parsed only to be
+    # re-serialized. It is only ever written by orjson/json.dumps, so it is valid JSON [PA]
+    meta = orjson.dumps({
+        'id': version_row.id, 'user_id': user_id, 'last_modified': version_row.last_modified
+    })
+    return meta[:-1] + b',"layout":' + layout_json.encode() + b'}'
 
 @app.route('/api/layout', methods=['GET'])
 @jwt_required()
 def get_garden_layout():
-    user_id = get_jwt_identity()
-    layout = GardenLayout.query.filter_by(user_id=user_id).first()
-    if layout:
-        return jsonify(layout=layout.to_dict()), 200
-    else:
-        # Return default empty layout if not set
-        return jsonify(layout=None), 200
+    user_id = _current_user_id()
+    # Conditional GET: read only the version columns first; a matching
+    # If-None-Match skips loading and serializing the layout [PA]
+    version_row = db.session.execute(_layout_version_by_user_stmt, {'uid': user_id}).one_or_none()
+    version = _version_tag(
+        f"layout-{user_id}", 1 if version_row else 0, version_row.last_modified if version_row else None
+    )
+    response = _not_modified(version)
+    if response is None:
+        body = b'{"layout":' + _layout_object_bytes(user_id, version_row) + b'}'
+        response = app.response_class(body, mimetype='application/json')
+        response.set_etag(version, weak=True)
+    # Per-user data: browsers may keep it but must revalidate every time
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
 
 @app.route('/api/layout', methods=['POST'])
 @jwt_required()
 def save_garden_layout():
-    user_id = get_jwt_identity()
+    user_id = _current_user_id()
     data = request.get_json()
     if not data or 'layout' not in data:
-        return jsonify(success=False, message='Missing layout data'), 400
+        return jsonify({'success': False, 'message': 'Missing layout data'}), 400
     try:
         new_layout = data['layout']
-        # Fetch existing layout if present
-        existing = GardenLayout.query.filter_by(user_id=user_id).first()
-        if existing:
+        # Fetch existing layout text if present; only the column is needed for the merge
+        existing_json = db.session.scalar(_layout_json_by_user_stmt, {'uid': user_id})
+        if existing_json is not None:
             try:
-                existing_layout = json.loads(existing.layout_json)
+                existing_layout = orjson.loads(existing_json)
             except Exception:
                 existing_layout = {}
-            # Merge: update only keys present in new_layout
-            merged_layout = existing_layout.copy() if isinstance(existing_layout, dict) else {}
-            for key, value in new_layout.items():
-                merged_layout[key] = value
-            existing.layout_json = json.dumps(merged_layout)
-            db.session.commit()
-            return jsonify(success=True, layout=existing.to_dict()), 200
+            # Merge: update only keys present in new_layout. The parsed dict is
+            # ours, so update it in place (one C-level merge, no copy) [PA]
+            merged_layout = existing_layout if isinstance(existing_layout, dict) else {}
+            merged_layout.update(new_layout)
         else:
-            layout = GardenLayout(user_id=user_id, layout_json=json.dumps(new_layout))
-            db.session.add(layout)
-            db.session.commit()
-            return jsonify(success=True, layout=layout.to_dict()), 200
-    except Exception as e:
-        return jsonify(success=False, message=f'Error saving layout: {str(e)}'), 500
+            merged_layout = new_layout
 
+        saved = _upsert_layout(user_id, orjson.dumps(merged_layout).decode())
+        db.session.commit()
+        return jsonify({'success': True, 'layout': {
+            'id': saved.id,
+            'user_id': saved.user_id,
+            'layout': merged_layout,
+            'last_modified': saved.last_modified
+        }})
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': f'Error saving layout: {str(e)}'}), 500
+
+# Dialects whose insert() supports ON CONFLICT DO UPDATE
+_UPSERT_INSERTS = {'postgresql': postgresql.insert, 'sqlite': sqlite.insert}
+
+def _upsert_layout(user_id, layout_json):
+    """
+    Insert or replace the user's layout in one statement keyed on the unique
+    user_id, so two first-time saves can't race into a duplicate INSERT [PA].
+    Returns the row's id, user_id and last_modified.
+    """
+    dialect = db.engine.dialect
+    dialect_insert = _UPSERT_INSERTS.get(dialect.name)
+    if dialect_insert is None or not dialect.insert_returning:
+        # No ON CONFLICT support, or no RETURNING (SQLite < 3.35): fall back to the ORM
+        layout = GardenLayout.query.filter_by(user_id=user_id).first()
+        if layout:
+            layout.layout_json = layout_json
+        else:
+            layout = GardenLayout(user_id=user_id, layout_json=layout_json)
+            db.session.add(layout)
+        db.session.flush()
+        return layout
+
+    stmt = dialect_insert(GardenLayout).values(user_id=user_id, layout_json=layout_json)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[GardenLayout.user_id],
+        # onupdate= isn't applied to ON CONFLICT updates, so stamp it here
+        set_={'layout_json': stmt.excluded.layout_json, 'last_modified': datetime.datetime.utcnow()}
+    ).returning(GardenLayout.id, GardenLayout.user_id, GardenLayout.last_modified)
+    return db.session.execute(stmt).one()
+
+
+# Built once at import; see get_planting_recommendations [PA]
+_last_family_for_bed_stmt = (
+    select(PlantType.rotation_family)
+    .select_from(GardenBed)
+    .outerjoin(Planting, Planting.bed_id == GardenBed.id)
+    .outerjoin(PlantType, PlantType.id == Planting.plant_type_id)
+    .where(GardenBed.id == bindparam('bed_id'), GardenBed.user_id == bindparam('uid'))
+    .order_by(Planting.year.desc().nullslast(), Planting.season.desc().nullslast())
+    .limit(1)
+)
+
+# Fields returned per recommended plant (add other relevant details here if needed)
+_REC_FIELDS = ('id', 'common_name', 'scientific_name', 'rotation_family', 'description')
+
+# Serialized recommendation bodies by rotation family, for one catalog version [PA]
+_recommendations_cache = (None, {})
 
 @app.route('/api/garden-beds/<int:bed_id>/recommendations', methods=['GET'])
 @jwt_required()  # Protect this route
 def get_planting_recommendations(bed_id):
     # TODO: Replace with actual user identification from auth token
     # user_id = 1
-    current_user_id = get_jwt_identity()
-
-    # Check if bed exists and belongs to user
-    bed = GardenBed.query.filter_by(id=bed_id, user_id=current_user_id).first()
-    if not bed:
-        return jsonify({'message': 'Garden bed not found or access denied'}), 404
+    current_user_id = _current_user_id()
 
     try:
-        # Find the most recent planting for this bed
-        most_recent_planting = Planting.query.filter_by(bed_id=bed_id) \
-            .order_by(Planting.year.desc(), Planting.season.desc()).first()
+        body = _recommendations_bytes(current_user_id, bed_id)
+        if body is None:
+            return jsonify({'message': 'Garden bed not found or access denied'}), 404
+        return app.response_class(body, mimetype='application/json'), 200
 
-        last_rotation_family = None
-        if most_recent_planting:
-            last_rotation_family = most_recent_planting.plant_type.rotation_family
+    except Exception as e:
+        logger.error("Error generating planting recommendations: %s", str(e))
+        return jsonify({'message': 'Failed to generate recommendations due to server error'}), 500
 
+def _recommendations_bytes(user_id, bed_id):
+    """
+    Serialized recommendations for one of the user's beds, or None when the
+    bed doesn't exist or belongs to someone else.
+    """
+    global _recommendations_cache
+    # One query checks the bed exists and belongs to the user and fetches the
+    # rotation family of its most recent planting. The outer joins keep the
+    # bed row when it has no plantings (family is then NULL) [PA]
+    row = db.session.execute(
+        _last_family_for_bed_stmt, {'bed_id': bed_id, 'uid': user_id}
+    ).one_or_none()
+    if row is None:
+        return None
+    last_rotation_family = row.rotation_family
+
+    # The body depends only on the family and the catalog, so serve it from
+    # cache while the catalog version is unchanged [PA]
+    version = _plant_catalog_version()
+    cached_version, bodies = _recommendations_cache
+    if cached_version != version:
+        bodies = {}
+        _recommendations_cache = (version, bodies)
+
+    body = bodies.get(last_rotation_family)
+    if body is None:
         # Query for plants NOT in the last rotation family
         recommendations_query = PlantType.query
         if last_rotation_family:
@@ -808,94 +1145,123 @@ def get_planting_recommendations(bed_id):
                 PlantType.rotation_family != last_rotation_family
             )
 
-        # Fetch recommended plants (limit results?)
-        recommended_plants = recommendations_query.order_by(PlantType.common_name).all()
-
-        recommendations_data = [
-            {
-                'id': plant.id,
-                'common_name': plant.common_name,
-                'scientific_name': plant.scientific_name,
-                'rotation_family': plant.rotation_family,
-                'description': plant.description,
-                # Add other relevant details if needed
-            } for plant in recommended_plants
-        ]
+        # Fetch recommended plants (limit results?) as plain rows of just the
+        # fields returned; no ORM instances to build [PA]
+        recommended_plants = recommendations_query.with_entities(
+            *(getattr(PlantType, field) for field in _REC_FIELDS)
+        ).order_by(PlantType.common_name).all()
 
-        return jsonify({
+        recommendations_data = [dict(zip(_REC_FIELDS, plant)) for plant in recommended_plants]
+        body = orjson.dumps({
             'last_planted_family': last_rotation_family,  # Provide context
             'recommendations': recommendations_data
-        }), 200
+        })
+        bodies[last_rotation_family] = body
+    return body
+
+# --- Dashboard API Route ---
 
+@app.route('/api/dashboard', methods=['GET'])
+@jwt_required()
+def get_dashboard():
+    """
+    The user's layout plus, when ?bed_id= is given, that bed's recommendations,
+    in one request instead of two. Each part has the same shape as its own
+    endpoint's payload; 'recommendations' is omitted without a bed_id.
+    """
+    user_id = _current_user_id()
+    bed_id = request.args.get('bed_id', type=int)
+    try:
+        version_row = db.session.execute(_layout_version_by_user_stmt, {'uid': user_id}).one_or_none()
+        body = b'{"layout":' + _layout_object_bytes(user_id, version_row)
+        if bed_id is not None:
+            recommendations = _recommendations_bytes(user_id, bed_id)
+            if recommendations is None:
+                return jsonify({'message': 'Garden bed not found or access denied'}), 404
+            body += b',"recommendations":' + recommendations
+        return app.response_class(body + b'}', mimetype='application/json')
     except Exception as e:
-        logger.error("Error generating planting recommendations: %s", str(e))
-        return jsonify({'message': 'Failed to generate recommendations due to server error'}), 500
+        logger.error("Error building dashboard: %s", str(e))
+        return jsonify({'message': 'Failed to load dashboard due to server error'}), 500
 
 @app.route('/api/beds/<int:bed_id>/plantings', methods=['POST'])
 def add_planting_to_bed(bed_id):
-    # Verify bed exists and belongs to user (if login is required)
-    bed = GardenBed.query.get(bed_id)
+    # Verify bed exists and belongs to user (if login is required); id only [PA]
+    bed = db.session.query(GardenBed.id).filter_by(id=bed_id).first()
     if not bed:
         return jsonify({'message': 'Garden bed not found'}), 404
     # Add user check if implementing authentication: 
     # if bed.user_id != session.get('user_id'): return jsonify({'message': 'Unauthorized'}), 403
 
     data = request.get_json()
-    logger.debug(f"Received data for new planting in bed {bed_id}: {data}")
+    logger.debug("Received data for new planting in bed %s: %s", bed_id, data)
 
     # Basic Input Validation [IV] [REH]
     required_fields = ['plant_type_id', 'year'] # Season could be optional or derived
     if not data:
-        logger.warning(f"Add planting request failed for bed {bed_id}: No data.")
+        logger.warning("Add planting request failed for bed %s: No data.", bed_id)
         return jsonify({'message': 'No input data provided'}), 400
-    if not all(field in data and data[field] for field in required_fields):
-        missing = [field for field in required_fields if field not in data or not data[field]]
-        logger.warning(f"Add planting request failed for bed {bed_id}: Missing fields: {missing}")
+    missing = missing_fields(data, required_fields)  # Single pass over the fields [PA]
+    if missing:
+        logger.warning("Add planting request failed for bed %s: Missing fields: %s", bed_id, missing)
         return jsonify({'message': f'Missing required fields: {", ".join(missing)}'}), 400
     
-    # Validate plant_type_id exists
-    plant_type = PlantType.query.get(data['plant_type_id'])
+    # Validate plant_type_id exists. SQLite doesn't enforce foreign keys, so this
+    # can't be left to an IntegrityError; the loaded row is reused by to_dict() below
+    plant_type = db.session.get(PlantType, data['plant_type_id'])
     if not plant_type:
-        logger.warning(f"Add planting request failed for bed {bed_id}: Invalid plant_type_id: {data['plant_type_id']}")
+        logger.warning("Add planting request failed for bed %s: Invalid plant_type_id: %s", bed_id, data['plant_type_id'])
         return jsonify({'message': 'Invalid plant type ID provided'}), 400
 
     try:
         new_planting = Planting(
             bed_id=bed_id,
             plant_type_id=data['plant_type_id'],
+            plant_type=plant_type,  # Already loaded; to_dict() reads its name without a query
             year=data['year'],
             season=data.get('season'), # Optional
-            date_planted=datetime.datetime.strptime(data['date_planted'], '%Y-%m-%d').date() if data.get('date_planted') else None, # Handle optional date
+            date_planted=_parse_date(data.get('date_planted')), # Handle optional date
             notes=data.get('notes'), # Optional
             quantity=data.get('quantity'), # Optional
             is_current=data.get('is_current', True) # Default to True if not provided
         )
         db.session.add(new_planting)
         db.session.commit()
-        logger.info(f"New planting record (ID: {new_planting.id}) added to bed {bed_id}.")
+        logger.info("New planting record (ID: %s) added to bed %s.", new_planting.id, bed_id)
         return jsonify(new_planting.to_dict()), 201 # [ISA]
 
     except ValueError as ve: # Handle potential date parsing errors
-        logger.warning(f"Add planting date format error for bed {bed_id}: {str(ve)}")
+        logger.warning("Add planting date format error for bed %s: %s", bed_id, ve)
         return jsonify({'message': 'Invalid date format. Please use YYYY-MM-DD.'}), 400
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Error adding planting to bed {bed_id}: {str(e)}")
+        logger.error("Error adding planting to bed %s: %s", bed_id, e)
         return jsonify({'message': 'Failed to add planting record due to server error'}), 500
 
+def _export_planting_options():
+    """
+    Loader options for the export's planting query. In debug mode every other
+    relationship raises on access, so a to_dict() that starts touching one
+    shows up as an error in development instead of a query per planting.
+    """
+    if app.debug:
+        return (joinedload(Planting.plant_type), raiseload('*'))
+    return (joinedload(Planting.plant_type),)
+
 # Data Management API Routes
 @app.route('/api/data/export', methods=['GET'])
 @jwt_required()
 def export_user_data():
-    current_user_id = get_jwt_identity()
-    user = User.query.get(current_user_id)
+    current_user_id = _current_user_id()
+    user = db.session.get(User, current_user_id)
     if not user:
         return jsonify({"msg": "User not found"}), 404
 
     plant_types = PlantType.query.all()
     garden_beds = GardenBed.query.filter_by(user_id=current_user_id).all()
     # plantings = Planting.query.filter_by(user_id=current_user_id).all() # Incorrect: Planting has no direct user_id
-    plantings = db.session.query(Planting).join(GardenBed, Planting.bed_id == GardenBed.id).filter(GardenBed.user_id == current_user_id).all()
+    # to_dict() reads plant_type, so it rides along in the same SELECT [PA]
+    plantings = db.session.query(Planting).options(*_export_planting_options()).join(GardenBed, Planting.bed_id == GardenBed.id).filter(GardenBed.user_id == current_user_id).all()
     garden_layout = GardenLayout.query.filter_by(user_id=current_user_id).first()
 
     export_data = {
@@ -906,13 +1272,9 @@ def export_user_data():
         "garden_layout": garden_layout.to_dict() if garden_layout else {}
     }
 
-    # Create an in-memory file for the JSON data
-    str_io = io.StringIO()
-    json.dump(export_data, str_io, indent=4)
-    mem_file = io.BytesIO()
-    mem_file.write(str_io.getvalue().encode('utf-8'))
-    mem_file.seek(0)
-    str_io.close()
+    # Create an in-memory file for the JSON data. orjson writes UTF-8 bytes
+    # directly (and formats the dates), so there's no str buffer to re-encode [PA]
+    mem_file = io.BytesIO(orjson.dumps(export_data, default=app.json.default, option=orjson.OPT_INDENT_2))
 
     return send_file(
         mem_file,
@@ -924,8 +1286,8 @@ def export_user_data():
 @app.route('/api/data/import', methods=['POST'])
 @jwt_required()
 def import_user_data():
-    current_user_id = get_jwt_identity()
-    user = User.query.get(current_user_id)
+    current_user_id = _current_user_id()
+    user = db.session.get(User, current_user_id)
     if not user:
         return jsonify({"msg": "User not found"}), 404
 
@@ -1029,7 +1391,7 @@ def import_user_data():
                 new_bed_id = garden_bed_id_map.get(old_bed_id)
 
                 if new_plant_type_id is None or new_bed_id is None:
-                    logger.warning(f"Skipping planting due to missing mapped ID: old_plant_type_id={old_plant_type_id}, old_bed_id={old_bed_id}")
+                    logger.warning("Skipping planting due to missing mapped ID: old_plant_type_id=%s, old_bed_id=%s", old_plant_type_id, old_bed_id)
                     continue
 
                 new_planting = Planting(
@@ -1038,34 +1400,37 @@ def import_user_data():
                     date_planted=datetime.datetime.fromisoformat(p_data['date_planted']).date() if p_data.get('date_planted') else None, # Ensure date object
                     notes=p_data.get('notes'),
                     quantity=p_data.get('quantity', 1),
-                    expected_harvest_date=datetime.date.fromisoformat(p_data['projected_harvest_date']) if p_data.get('projected_harvest_date') else None, # Corrected name and parse as date
+                    expected_harvest_date=_parse_date(p_data.get('projected_harvest_date')), # Corrected name and parse as date
                 )
                 db.session.add(new_planting)
 
             # 6. Import Garden Layout
-            logger.debug(f"Import: garden_bed_id_map = {garden_bed_id_map}") # Log bed ID map
+            logger.debug("Import: garden_bed_id_map = %s", garden_bed_id_map) # Log bed ID map
 
             layout_data = imported_data.get("garden_layout")
             if layout_data and isinstance(layout_data.get('layout'), dict): # Check 'layout' key for the dict
                 actual_layout_content = layout_data.get('layout', {}) # Get the actual content
-                logger.debug(f"Import: Original actual_layout_content = {json.dumps(actual_layout_content)}")
+                # json.dumps of the whole layout only when debug output is on [PA]
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Import: Original actual_layout_content = %s", json.dumps(actual_layout_content))
 
                 # Attempt to update bed IDs within actual_layout_content
                 if 'beds' in actual_layout_content and isinstance(actual_layout_content['beds'], list):
-                    logger.debug(f"Import: Found 'beds' list in actual_layout_content. Processing {len(actual_layout_content['beds'])} items.")
+                    logger.debug("Import: Found 'beds' list in actual_layout_content. Processing %s items.", len(actual_layout_content['beds']))
                     for bed_item in actual_layout_content['beds']:
                         if isinstance(bed_item, dict) and 'id' in bed_item:
                             old_bed_item_id = bed_item['id']
-                            logger.debug(f"Import: Processing bed_item with old_id = {old_bed_item_id}")
+                            logger.debug("Import: Processing bed_item with old_id = %s", old_bed_item_id)
                             if old_bed_item_id in garden_bed_id_map:
                                 bed_item['id'] = garden_bed_id_map[old_bed_item_id]
-                                logger.debug(f"Import: Updated bed_item id to {bed_item['id']}")
+                                logger.debug("Import: Updated bed_item id to %s", bed_item['id'])
                             else:
-                                logger.warning(f"Import: old_bed_item_id {old_bed_item_id} not found in garden_bed_id_map.")
+                                logger.warning("Import: old_bed_item_id %s not found in garden_bed_id_map.", old_bed_item_id)
                 else:
                     logger.debug("Import: No 'beds' list found in actual_layout_content or it's not a list.")
 
-                logger.debug(f"Import: Modified actual_layout_content = {json.dumps(actual_layout_content)}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Import: Modified actual_layout_content = %s", json.dumps(actual_layout_content))
                 
                 new_layout = GardenLayout(
                     user_id=current_user_id,
@@ -1073,7 +1438,7 @@ def import_user_data():
                 )
                 db.session.add(new_layout)
             elif layout_data:
-                logger.warning(f"Import: garden_layout data found, but 'layout' key is missing or not a dict. Data: {layout_data}")
+                logger.warning("Import: garden_layout data found, but 'layout' key is missing or not a dict. Data: %s", layout_data)
             else:
                 logger.debug("Import: No garden_layout data found in import file.")
 
@@ -1082,7 +1447,7 @@ def import_user_data():
 
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Error during import: {e}") # Use logger.error here too
+            logger.error("Error during import: %s", e) # Use logger.error here too
             return jsonify({"msg": f"Error during import: {str(e)}"}), 500
     else:
         return jsonify({"msg": "Invalid file type. Please upload a .json file"}), 400
@@ -1094,5 +1459,10 @@ if __name__ == '__main__':
     # with app.app_context():
         # You might perform initial db checks or setup here if necessary
         # pass
+    # The Werkzeug dev server (and its debugger) is for local development only;
+    # production runs under gunicorn via wsgi.py [SFT][PA]
+    # Opt-in only: FLASK_DEBUG must be set (e.g. FLASK_DEBUG=1 python app.py)
+    if not get_debug_flag():
+        raise SystemExit("Refusing to start the development server without FLASK_DEBUG=1; in production use: gunicorn wsgi:app")
     logger.info("Starting Flask server...")
     app.run(debug=True, host='0.0.0.0', port=5000) # Use host='0.0.0.0' to allow external access if needed
@@ -0,0 +1,14 @@
+# gunicorn.conf.py
+# Production server settings, picked up automatically by: gunicorn wsgi:app
+# (run from this directory). Flask's built-in server is for development only.
+import multiprocessing
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:5000')
+
+# Threaded workers: each request is auth + a few short SQL round-trips, and the
+# database drivers release the GIL while waiting, so threads overlap that I/O
+# without porting handlers to async [PA]
+worker_class = 'gthread'
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
@@ -0,0 +1,40 @@
+# json_provider.py
+# Flask JSON provider backed by orjson for faster response serialization [PA]
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Serialize with orjson. datetime/date values are emitted as ISO-8601;
+    anything else orjson can't handle (e.g. Decimal) falls back to Flask's default().
+    Request bodies are parsed with orjson too.
+    """
+
+    # Clients don't rely on key order, and sorting costs a pass per dict
+    sort_keys = False
+
+    def _dump_bytes(self, obj, indent=False, sort_keys=None, default=None):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if self.sort_keys if sort_keys is None else sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=default or self.default, option=option)
+
+    def dumps(self, obj, **kwargs):
+        return self._dump_bytes(
+            obj, kwargs.get('indent'), kwargs.get('sort_keys'), kwargs.get('default')
+        ).decode()
+
+    def loads(self, s, **kwargs):
+        # Hooks like object_hook are json-module features; honour them via the stdlib
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response; no str decode/re-encode
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(self._dump_bytes(obj, indent), mimetype=self.mimetype)
@@ -0,0 +1,62 @@
+# jwt_cache.py
+# Memoize decoded JWTs so repeat requests with the same token skip
+# signature verification and claim parsing [PA][SFT]
+import threading
+import time
+
+from flask_jwt_extended import JWTManager
+
+from security import hash_token
+
+DEFAULT_MAX_ENTRIES = 10000
+# Upper bound on how long a decoded token is reused before being re-verified
+DEFAULT_TTL_SECONDS = 300
+
+
+class CachingJWTManager(JWTManager):
+    """
+    JWTManager that caches successfully decoded tokens until their 'exp', or
+    for at most ttl seconds, whichever comes first. Only a hash of the token
+    is kept as the key, never the raw token.
+    """
+
+    def __init__(self, app=None, add_context_processor=False,
+                 max_entries=DEFAULT_MAX_ENTRIES, ttl=DEFAULT_TTL_SECONDS):
+        self._decoded_tokens = {}
+        self._lock = threading.Lock()
+        self.max_entries = max_entries
+        self.ttl = ttl
+        super().__init__(app, add_context_processor)
+
+    def init_app(self, app, add_context_processor=False):
+        super().init_app(app, add_context_processor)
+        # Deployments with many concurrent users can raise the bound via config
+        self.max_entries = app.config.get('JWT_DECODE_CACHE_SIZE', self.max_entries)
+        self.ttl = app.config.get('JWT_DECODE_CACHE_TTL', self.ttl)
+
+    def _decode_jwt_from_config(self, encoded_token, csrf_value=None, allow_expired=False):
+        # CSRF-checked and expired-token decodes are rare; always verify those fully
+        if csrf_value is not None or allow_expired:
+            return super()._decode_jwt_from_config(encoded_token, csrf_value, allow_expired)
+
+        key = hash_token(encoded_token)
+        cached = self._decoded_tokens.get(key)
+        if cached is not None:
+            claims, expires_at = cached
+            if time.time() < expires_at:
+                return claims
+            # Stale: fall through to a full decode, which re-caches the token or,
+            # past its 'exp', raises ExpiredSignatureError
+            with self._lock:
+                self._decoded_tokens.pop(key, None)
+
+        claims = super()._decode_jwt_from_config(encoded_token)
+        with self._lock:
+            if len(self._decoded_tokens) >= self.max_entries:
+                # Dicts keep insertion order, so this drops the oldest entry
+                self._decoded_tokens.pop(next(iter(self._decoded_tokens)))
+            expires_at = time.time() + self.ttl
+            if claims.get('exp') is not None:
+                expires_at = min(expires_at, claims['exp'])
+            self._decoded_tokens[key] = (claims, expires_at)
+        return claims
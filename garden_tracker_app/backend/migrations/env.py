@@ -10,8 +10,10 @@ from alembic import context
 config = context.config
 
 # Interpret the config file for Python logging.
-# This line sets up loggers basically.
-fileConfig(config.config_file_name)
+# This line sets up loggers basically. Offline (--sql) runs only render
+# DDL, and programmatic callers can opt out via config.attributes.
+if not context.is_offline_mode() and config.attributes.get('configure_logger', True):
+    fileConfig(config.config_file_name)
 logger = logging.getLogger('alembic.env')
 
 
@@ -97,6 +99,10 @@ def run_migrations_online():
     connectable = get_engine()
 
     with connectable.connect() as connection:
+        # Only SQLite needs ALTERs rendered as batch (copy-and-move) ops;
+        # other backends can alter tables in place. Assigned outright: Migrate()
+        # defaults render_as_batch to True, so it is always already set here.
+        conf_args['render_as_batch'] = connection.dialect.name == 'sqlite'
         context.configure(
             connection=connection,
             target_metadata=get_metadata(),
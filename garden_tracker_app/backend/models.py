@@ -1,9 +1,12 @@
 from flask_sqlalchemy import SQLAlchemy
 import datetime
+import orjson
 
 # Initialize SQLAlchemy instance.
 # This will be linked to the Flask app instance later using db.init_app(app)
-db = SQLAlchemy()
+# Objects stay loaded after commit so handlers can build responses from them
+# without a refresh SELECT [PA]
+db = SQLAlchemy(session_options={'expire_on_commit': False})
 
 # --- Database Models ---
 
@@ -16,13 +19,14 @@ class GardenLayout(db.Model):
     def __repr__(self):
         return f'<GardenLayout user_id={self.user_id}>'
 
+    # Dates and datetimes are returned as-is: the orjson-backed JSON provider
+    # emits them as ISO-8601, so no isoformat() per field [PA]
     def to_dict(self):
-        import json
         return {
             'id': self.id,
             'user_id': self.user_id,
-            'layout': json.loads(self.layout_json),
-            'last_modified': self.last_modified.isoformat() if self.last_modified else None,
+            'layout': orjson.loads(self.layout_json),
+            'last_modified': self.last_modified,
         }
 
 
@@ -33,7 +37,9 @@ class User(db.Model):
     creation_date = db.Column(db.DateTime, default=datetime.datetime.utcnow)
     last_login_at = db.Column(db.DateTime)
     preferred_units = db.Column(db.String(10), default='imperial')  # 'imperial' or 'metric'
-    garden_beds = db.relationship('GardenBed', backref='owner', lazy='dynamic')
+    # Plain lazy collections (not 'dynamic') so they can be eager-loaded with
+    # selectinload/joinedload where a caller needs them [PA]
+    garden_beds = db.relationship('GardenBed', back_populates='owner')
 
     def __repr__(self):
         return f'<User {self.email}>'
@@ -49,13 +55,13 @@ class User(db.Model):
             'preferences': {
                 'preferred_units': self.preferred_units
             },
-            'creation_date': self.creation_date.isoformat() if self.creation_date else None,
-            'last_login_at': self.last_login_at.isoformat() if self.last_login_at else None
+            'creation_date': self.creation_date,
+            'last_login_at': self.last_login_at
         }
 
 class GardenBed(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False, index=True)
     name = db.Column(db.String(100), nullable=False)
     shape = db.Column(db.String(20), nullable=False)  # rectangle, circle, pill, c-rectangle
     shape_params = db.Column(db.JSON, nullable=False)  # shape-specific parameters
@@ -66,6 +72,7 @@ class GardenBed(db.Model):
 
     creation_date = db.Column(db.DateTime, default=datetime.datetime.utcnow)
     last_modified = db.Column(db.DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
+    owner = db.relationship('User', back_populates='garden_beds')
 
     def __repr__(self):
         return f'<GardenBed {self.name}>'
@@ -80,8 +87,8 @@ class GardenBed(db.Model):
             'width': self.width,    # Deprecated
             'unit_measure': self.unit_measure,
             'notes': self.notes,
-            'creation_date': self.creation_date.isoformat(),
-            'last_modified': self.last_modified.isoformat()
+            'creation_date': self.creation_date,
+            'last_modified': self.last_modified
         }
 
 class PlantType(db.Model):
@@ -93,7 +100,9 @@ class PlantType(db.Model):
     avg_spread = db.Column(db.Float)  # Consider units
     rotation_family = db.Column(db.String(50), index=True)  # e.g., Nightshade, Legume
     notes = db.Column(db.Text)
-    plantings = db.relationship('Planting', backref='plant_type', lazy='dynamic')
+    # Bumped on every write; drives the /api/plants ETag [PA]
+    last_modified = db.Column(db.DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
+    plantings = db.relationship('Planting', back_populates='plant_type')
 
     def __repr__(self):
         return f'<PlantType {self.common_name}>'
@@ -122,6 +131,17 @@ class Planting(db.Model):
     notes = db.Column(db.Text)
     is_current = db.Column(db.Boolean, default=True, index=True)
     quantity = db.Column(db.String(50)) # Optional, e.g., "5 plants", "2 sq ft"
+    # Bumped on every write; drives the per-bed plantings ETag [PA]
+    last_modified = db.Column(db.DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
+    plant_type = db.relationship('PlantType', back_populates='plantings')
+
+    # Composite indexes for the per-bed filters and ordering used by the API [PA]
+    __table_args__ = (
+        db.Index('ix_planting_bed_id_is_current', 'bed_id', 'is_current'),
+        # plant_type_id is carried so the latest-planting lookup for
+        # recommendations is answered from the index alone
+        db.Index('ix_planting_bed_year_season', 'bed_id', 'year', 'season', 'plant_type_id'),
+    )
 
     def __repr__(self):
         return f'<Planting {self.id} in Bed {self.bed_id}>'
@@ -136,8 +156,8 @@ class Planting(db.Model):
             'plant_common_name': self.plant_type.common_name if self.plant_type else 'Unknown Plant Type',
             'year': self.year,
             'season': self.season,
-            'date_planted': self.date_planted.isoformat() if self.date_planted else None,
-            'expected_harvest_date': self.expected_harvest_date.isoformat() if self.expected_harvest_date else None, # Add to serialization
+            'date_planted': self.date_planted,
+            'expected_harvest_date': self.expected_harvest_date, # Add to serialization
             'notes': self.notes,
             'is_current': self.is_current,
             'quantity': self.quantity
@@ -52,5 +52,5 @@ def import_plants():
         }), 200
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Error importing plants: {str(e)}")
+        logger.error("Error importing plants: %s", e)
         return jsonify({'message': 'Failed to import plants due to server error'}), 500
@@ -0,0 +1,57 @@
+# security.py
+# Password hashing helpers. New hashes use Argon2id; legacy Werkzeug pbkdf2
+# hashes still verify and are upgraded on the user's next login [SFT][PA]
+#
+# hash_password/verify_password are deliberately slow and are for user-chosen
+# passwords only. High-entropy machine secrets (tokens) go through hash_token,
+# which is a fast digest: there is nothing to brute-force in them.
+import hashlib
+
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from werkzeug.security import check_password_hash
+
+# OWASP's minimum Argon2id profile (19 MiB, 2 passes, 1 lane): far cheaper per
+# login than the library default (64 MiB, 3 passes, 4 lanes). Hashes made with
+# other parameters report needs_rehash and are rewritten on the next login
+_hasher = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+
+# Verified against when there is no stored hash, so unknown emails cost the
+# same as wrong passwords and login timing doesn't reveal which accounts exist
+_DUMMY_HASH = _hasher.hash('dummy-password-for-timing')
+
+
+def hash_password(password):
+    """Hash a plaintext password with Argon2id."""
+    return _hasher.hash(password)
+
+
+def verify_password(stored_hash, password):
+    """
+    Check a password against a stored hash of either format. A missing
+    hash (unknown user) still does a full verify before failing.
+    Returns (matches, needs_rehash); needs_rehash is only meaningful on a match.
+    """
+    if not stored_hash:
+        try:
+            _hasher.verify(_DUMMY_HASH, password)
+        except VerificationError:
+            pass
+        return False, False
+    if stored_hash.startswith('$argon2'):
+        try:
+            _hasher.verify(stored_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False, False
+        return True, _hasher.check_needs_rehash(stored_hash)
+    # Legacy Werkzeug hash (e.g. pbkdf2:sha256); always upgrade after a match
+    matches = check_password_hash(stored_hash, password)
+    return matches, matches
+
+
+def hash_token(token):
+    """
+    16-byte BLAKE2b digest of a token, for use as a lookup key so the raw
+    token is never stored. Not for passwords: it is fast by design.
+    """
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
@@ -53,3 +53,17 @@ def validate_bed_shape_and_params(shape, shape_params):
         if shape_params["missing_height"] >= shape_params["height"]:
             return False, "C-rectangle 'missing_height' must be less than 'height'."
     return True, None
+
+def missing_fields(data, required_fields):
+    """
+    Return the required fields that are absent or empty in data, in one pass.
+    An empty list means the payload has everything. [IV][DRY]
+    """
+    return [field for field in required_fields if not data.get(field)]
+
+def non_string_fields(data, fields):
+    """
+    Return the fields present in data whose value isn't a string, e.g. a JSON
+    number sent as an email. An empty list means they're all strings. [IV]
+    """
+    return [field for field in fields if field in data and not isinstance(data[field], str)]
@@ -0,0 +1,7 @@
+# wsgi.py
+# WSGI entry point for production servers, e.g. from this directory:
+#   gunicorn wsgi:app
+# (gunicorn.conf.py here is picked up automatically)
+from app import app
+
+__all__ = ['app']